@@ -0,0 +1,214 @@
+"""Conversation storage backends for Machine Spirit.
+
+The orchestrator keeps a short rolling history per session. Where that
+history lives is pluggable through the :class:`ConversationStore` protocol:
+
+- :class:`InMemoryConversationStore` keeps everything in the current process
+  (the default; state is lost on restart and not shared between workers).
+- :class:`RedisConversationStore` keeps each session as a Redis list so
+  several workers can serve the same conversation, fronted by a small
+  in‑process LRU of hot sessions that is validated against Redis on read.
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict, deque
+import json
+import secrets
+from typing import Any, Deque, Dict, List, Optional, Protocol, Tuple
+
+
+Message = Dict[str, Any]
+
+
+class ConversationStore(Protocol):
+    """Minimal interface the orchestrator needs from a history backend."""
+
+    # True when messages are encoded on append rather than kept as objects.
+    serializes_messages: bool
+
+    def append(self, session_id: str, message: Message) -> None:
+        """Append a message, dropping the oldest ones beyond the history cap."""
+        ...
+
+    def get(self, session_id: str) -> List[Message]:
+        """Return a copy of the session's history, oldest message first."""
+        ...
+
+    def clear(self, session_id: str) -> None:
+        """Forget a session's history."""
+        ...
+
+
+def _check_max_history(max_history: int) -> None:
+    # Both backends must agree on the cap: deque(maxlen=0) keeps nothing while
+    # ``LTRIM key -0 -1`` keeps everything, so reject it up front.
+    if max_history < 1:
+        raise ValueError(f"max_history must be at least 1, got {max_history}")
+
+
+class InMemoryConversationStore:
+    """Process‑local store: an LRU of sessions, each a bounded deque.
+
+    Sessions are kept in least‑recently‑used order and capped at
+    ``max_sessions``; each buffer is capped at ``max_history`` so old
+    messages fall off in O(1). Not thread‑safe, like the orchestrator that
+    owns it.
+    """
+
+    serializes_messages = False
+
+    def __init__(self, max_history: int, max_sessions: int) -> None:
+        _check_max_history(max_history)
+        self.max_history = max_history
+        self.max_sessions = max_sessions
+        self._sessions: OrderedDict[str, Deque[Message]] = OrderedDict()
+
+    def append(self, session_id: str, message: Message) -> None:
+        history = self._sessions.get(session_id)
+        if history is None:
+            history = deque(maxlen=self.max_history)
+            self._sessions[session_id] = history
+            # Evict the least recently used session once over capacity
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        else:
+            self._sessions.move_to_end(session_id)
+        # The deque's maxlen drops the oldest message once full
+        history.append(message)
+
+    def get(self, session_id: str) -> List[Message]:
+        return list(self._sessions.get(session_id, ()))
+
+    def clear(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+
+def _as_str(value: Any) -> str:
+    """Normalise a Redis reply (bytes unless ``decode_responses``) to ``str``."""
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return "" if value is None else str(value)
+
+
+class _CachedHistory:
+    """A session history cached in‑process, tagged with its Redis version."""
+
+    __slots__ = ("version", "messages")
+
+    def __init__(self, version: Tuple[str, int], messages: Deque[Message]) -> None:
+        self.version = version
+        self.messages = messages
+
+
+class RedisConversationStore:
+    """Redis‑backed store with a validated in‑process LRU of hot sessions.
+
+    Each session is a Redis list at ``<key_prefix>messages:<session_id>``
+    holding JSON‑encoded messages, so message metadata must be
+    JSON‑serializable. Next to it, a ``<key_prefix>meta:<session_id>`` hash
+    holds the session's version: an ``epoch`` token chosen when the session
+    is (re)created and a ``seq`` counter bumped by every append. Both keys
+    share the session TTL.
+
+    An append costs one round trip (a ``MULTI`` pipeline of ``RPUSH``,
+    ``LTRIM``, ``HSETNX``/``HINCRBY`` and ``EXPIRE``). A read of a cached
+    session costs one ``HMGET`` of the version; the cached copy is served only
+    if the version still matches, so appends from other workers, ``clear``
+    and TTL expiry are all picked up. Otherwise the list is reloaded.
+
+    Like the in‑memory store, an instance is not thread‑safe; Redis itself is
+    what lets several workers share sessions. ``redis-py`` is only imported
+    when no ``client`` is supplied.
+    """
+
+    serializes_messages = True
+
+    def __init__(
+        self,
+        max_history: int,
+        url: str = "redis://localhost:6379/0",
+        ttl_seconds: int = 86400,
+        cache_sessions: int = 256,
+        key_prefix: str = "machine_spirit:conversation:",
+        client: Optional[Any] = None,
+    ) -> None:
+        _check_max_history(max_history)
+        if client is None:
+            try:
+                import redis
+            except ImportError as exc:  # pragma: no cover - depends on the environment
+                raise RuntimeError(
+                    "RedisConversationStore requires the 'redis' package (pip install redis)."
+                ) from exc
+            client = redis.Redis.from_url(url)
+        self._redis = client
+        self.max_history = max_history
+        self.ttl_seconds = ttl_seconds
+        self.cache_sessions = cache_sessions
+        self.key_prefix = key_prefix
+        self._cache: OrderedDict[str, _CachedHistory] = OrderedDict()
+
+    def _key(self, session_id: str) -> str:
+        return self.key_prefix + "messages:" + session_id
+
+    def _meta_key(self, session_id: str) -> str:
+        return self.key_prefix + "meta:" + session_id
+
+    def append(self, session_id: str, message: Message) -> None:
+        key = self._key(session_id)
+        meta = self._meta_key(session_id)
+        encoded = json.dumps(message)
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.rpush(key, encoded)
+        pipe.ltrim(key, -self.max_history, -1)
+        pipe.hsetnx(meta, "epoch", secrets.token_hex(8))
+        pipe.hincrby(meta, "seq", 1)
+        if self.ttl_seconds > 0:
+            pipe.expire(key, self.ttl_seconds)
+            pipe.expire(meta, self.ttl_seconds)
+        pipe.hget(meta, "epoch")
+        results = pipe.execute()
+        seq = int(results[3])
+        epoch = _as_str(results[-1])
+
+        entry = self._cache.get(session_id)
+        if entry is None:
+            # A cold session is loaded in full on its next read rather than
+            # cached from a partial view.
+            return
+        if entry.version == (epoch, seq - 1):
+            # Cache what Redis holds, not the caller's object, so a hit
+            # returns exactly what a reload or another worker would.
+            entry.messages.append(json.loads(encoded))
+            entry.version = (epoch, seq)
+            self._cache.move_to_end(session_id)
+        else:
+            # Another worker wrote in between; the cached copy is stale.
+            self._cache.pop(session_id, None)
+
+    def get(self, session_id: str) -> List[Message]:
+        meta = self._meta_key(session_id)
+        entry = self._cache.get(session_id)
+        if entry is not None:
+            epoch, seq = self._redis.hmget(meta, "epoch", "seq")
+            if seq is not None and entry.version == (_as_str(epoch), int(seq)):
+                self._cache.move_to_end(session_id)
+                return list(entry.messages)
+            self._cache.pop(session_id, None)
+
+        pipe = self._redis.pipeline(transaction=True)
+        pipe.lrange(self._key(session_id), 0, -1)
+        pipe.hmget(meta, "epoch", "seq")
+        raw, (epoch, seq) = pipe.execute()
+        messages: List[Message] = [json.loads(item) for item in raw]
+        if seq is not None and self.cache_sessions > 0:
+            version = (_as_str(epoch), int(seq))
+            self._cache[session_id] = _CachedHistory(version, deque(messages, maxlen=self.max_history))
+            if len(self._cache) > self.cache_sessions:
+                self._cache.popitem(last=False)
+        return messages
+
+    def clear(self, session_id: str) -> None:
+        self._redis.delete(self._key(session_id), self._meta_key(session_id))
+        self._cache.pop(session_id, None)
@@ -13,14 +13,29 @@ to the self_model, and prepares the ground for future expansion.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Literal
+from typing import Any, Dict, List, Optional, Literal, Tuple
+import time
 
+from .conversation_store import ConversationStore, InMemoryConversationStore, RedisConversationStore
 from .self_model import SelfModel, EpistemicSnapshot
 
 
 ConversationMode = Literal["default", "DEV", "OPS", "STORY", "ANALYST"]
 
+# Reply prefix per conversation mode; unknown modes get no prefix.
+_MODE_PREFIX: Dict[str, str] = {
+    "DEV": "[DEV] ",
+    "OPS": "[OPS] ",
+    "STORY": "[STORY] ",
+    "ANALYST": "[ANALYST] ",
+    "default": "",
+}
+
+# Sources reported by the stub reply logic; copied into each snapshot.
+_STUB_SOURCES: Tuple[str, ...] = ("internal_stub",)
+
 
 @dataclass
 class OrchestratorConfig:
@@ -28,7 +43,17 @@ class OrchestratorConfig:
 
     default_mode: ConversationMode = "default"
     max_history_messages: int = 50
+    max_sessions: int = 1024
     enable_autonomy: bool = True
+    # Conversation history backend: "memory" (process‑local) or "redis".
+    store_backend: Literal["memory", "redis"] = "memory"
+    redis_url: str = "redis://localhost:6379/0"
+    session_ttl_seconds: int = 86400
+    # Hot sessions cached in‑process in front of Redis.
+    store_cache_sessions: int = 256
+    # Deduplication of short, frequently repeated message texts.
+    content_pool_size: int = 4096
+    content_pool_max_len: int = 512
 
 
 class MachineSpiritOrchestrator:
@@ -43,15 +68,32 @@ class MachineSpiritOrchestrator:
 
     This class is intentionally written to be easy to extend: almost every
     logically distinct step is isolated into its own method.
+
+    An orchestrator, its SelfModel and its conversation store are not
+    thread‑safe. Drive each instance from a single thread or event loop (as
+    an ASGI worker does) and scale out with more workers, not more threads.
     """
 
-    def __init__(self, self_model: SelfModel, config: Optional[OrchestratorConfig] = None) -> None:
+    def __init__(
+        self,
+        self_model: SelfModel,
+        config: Optional[OrchestratorConfig] = None,
+        store: Optional[ConversationStore] = None,
+    ) -> None:
         self.self_model = self_model
         self.config = config or OrchestratorConfig()
 
-        # In–memory conversation buffers: {session_id: [..messages..]}
-        # In a real deployment this would likely be persisted or off‑loaded.
-        self._conversations: Dict[str, List[Dict[str, Any]]] = {}
+        # Conversation buffers per session; an explicitly passed store wins
+        # over the backend selected in the config.
+        self._conversations: ConversationStore = store or self._build_store()
+
+        # LRU pool of user message texts so identical short messages
+        # (greetings, retries) share a single string object across all
+        # buffers. Pointless when the store serializes messages anyway.
+        self._content_pool: OrderedDict[str, str] = OrderedDict()
+        self._pool_user_content: bool = (
+            self.config.content_pool_size > 0 and not self._conversations.serializes_messages
+        )
 
     # ------------------------------------------------------------------
     # Public API
@@ -90,16 +132,18 @@ class MachineSpiritOrchestrator:
             - "self_state": lightweight snapshot of the self model
         """
         mode = mode or self.config.default_mode
+        # One wall‑clock reading per message, shared by every step below
+        now = time.time()
 
         # 1) Register that we are active and update runtime state
-        self.self_model.track_activity(user_id=user_id, session_id=session_id)
+        self.self_model.track_activity(user_id=user_id, session_id=session_id, now=now)
         self.self_model.set_current_mode(mode)
 
         # 2) Append user message to conversation history
         self._append_message(session_id, role="user", content=text, metadata=metadata or {})
 
         # 3) High‑level reasoning & routing (currently a stubbed pipeline)
-        plan = self._draft_plan(text=text, mode=mode, session_id=session_id)
+        plan = self._draft_plan(text=text, mode=mode, session_id=session_id, now=now)
         tool_results = self._maybe_call_tools(plan=plan, session_id=session_id)
         reply_text, epistemic = self._generate_reply(
             text=text,
@@ -129,16 +173,52 @@ class MachineSpiritOrchestrator:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _build_store(self) -> ConversationStore:
+        """Create the conversation store selected by ``config.store_backend``."""
+        cfg = self.config
+        if cfg.store_backend == "memory":
+            return InMemoryConversationStore(
+                max_history=cfg.max_history_messages,
+                max_sessions=cfg.max_sessions,
+            )
+        if cfg.store_backend == "redis":
+            return RedisConversationStore(
+                max_history=cfg.max_history_messages,
+                url=cfg.redis_url,
+                ttl_seconds=cfg.session_ttl_seconds,
+                cache_sessions=cfg.store_cache_sessions,
+            )
+        raise ValueError(f"Unknown conversation store backend: {cfg.store_backend!r}")
+
     def _append_message(self, session_id: str, role: str, content: str, metadata: Dict[str, Any]) -> None:
-        """Append a message to the in‑memory conversation buffer."""
-        history = self._conversations.setdefault(session_id, [])
-        history.append({"role": role, "content": content, "metadata": metadata})
-        # Truncate history if needed
-        max_h = self.config.max_history_messages
-        if len(history) > max_h:
-            del history[0 : len(history) - max_h]
-
-    def _draft_plan(self, text: str, mode: ConversationMode, session_id: str) -> Dict[str, Any]:
+        """Append a message to the session's conversation buffer."""
+        # Replies embed the user's text and are nearly always unique, so only
+        # user payloads are worth deduplicating.
+        if role == "user" and self._pool_user_content:
+            content = self._pool_content(content)
+        self._conversations.append(session_id, {"role": role, "content": content, "metadata": metadata})
+
+    def _pool_content(self, content: str) -> str:
+        """Return the pooled instance of ``content`` when it is short enough to share."""
+        if len(content) >= self.config.content_pool_max_len:
+            return content
+        pool = self._content_pool
+        pooled = pool.get(content)
+        if pooled is not None:
+            pool.move_to_end(content)
+            return pooled
+        pool[content] = content
+        if len(pool) > self.config.content_pool_size:
+            pool.popitem(last=False)
+        return content
+
+    def _draft_plan(
+        self,
+        text: str,
+        mode: ConversationMode,
+        session_id: str,
+        now: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Create a very simple 'plan' object for what to do with the message.
 
         In future this will call the reasoning cortex + knowledge retrieval,
@@ -162,6 +242,7 @@ class MachineSpiritOrchestrator:
             event_type="plan_drafted",
             description=f"Drafted simple plan with mode={mode}",
             metadata={"session_id": session_id},
+            now=now,
         )
         return plan
 
@@ -193,23 +274,14 @@ class MachineSpiritOrchestrator:
         _ = (plan, tool_results, session_id)  # placeholders for future use
 
         # Minimal example behaviour per mode
-        if mode == "DEV":
-            prefix = "[DEV] "
-        elif mode == "OPS":
-            prefix = "[OPS] "
-        elif mode == "STORY":
-            prefix = "[STORY] "
-        elif mode == "ANALYST":
-            prefix = "[ANALYST] "
-        else:
-            prefix = ""
+        prefix = _MODE_PREFIX.get(mode, "")
 
         reply = f"{prefix}Machine Spirit has received: {text!r}. Real reasoning core not wired yet."
 
         # Basic epistemic snapshot: low confidence because this is stub logic.
         epistemic = EpistemicSnapshot(
             confidence="low",
-            sources=["internal_stub"],
+            sources=_STUB_SOURCES,
             notes="Using placeholder echo logic; no real model consulted yet.",
         )
         return reply, epistemic
@@ -219,9 +291,9 @@ class MachineSpiritOrchestrator:
     # ------------------------------------------------------------------
 
     def get_conversation_history(self, session_id: str) -> List[Dict[str, Any]]:
-        """Return the current in‑memory history for a session."""
-        return list(self._conversations.get(session_id, []))
+        """Return the current history for a session."""
+        return self._conversations.get(session_id)
 
     def clear_conversation_history(self, session_id: str) -> None:
         """Clear a session's conversation buffer."""
-        self._conversations.pop(session_id, None)
+        self._conversations.clear(session_id)
@@ -11,21 +11,80 @@ It is intentionally generic and serializable so it can be:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Optional, Literal
+from collections import deque
+from dataclasses import dataclass, field, fields
+from itertools import islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Literal, Sequence, Set, Tuple
+import json
 import time
 
+try:  # optional fast JSON encoder
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
 
 ConfidenceLevel = Literal["low", "medium", "high"]
 
+# How many of the most recent narrative events are included in to_dict().
+NARRATIVE_EXPORT_LIMIT = 50
+
+
+def _json_bytes(value: Any) -> bytes:
+    """Encode ``value`` as compact UTF‑8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _reduce_frozen(obj: Any) -> Tuple[Any, ...]:
+    """Pickle a frozen dataclass by calling its constructor again.
+
+    The default slots protocol restores fields with ``setattr``, which a
+    frozen class compiled with mypyc rejects.
+    """
+    return (type(obj), tuple(getattr(obj, f.name) for f in fields(obj)))
+
 
-@dataclass
 class EpistemicSnapshot:
-    """Represents an epistemic self‑assessment for a single response."""
+    """Represents an epistemic self‑assessment for a single response.
+
+    A plain ``__slots__`` class: one is created per reply, so it carries no
+    per‑instance ``__dict__``.
+    """
+
+    __slots__ = ("confidence", "sources", "notes")
+
+    def __init__(
+        self,
+        confidence: ConfidenceLevel,
+        sources: Optional[Iterable[str]] = None,
+        notes: str = "",
+    ) -> None:
+        self.confidence: ConfidenceLevel = confidence
+        self.sources: List[str] = list(sources) if sources is not None else []
+        self.notes: str = notes
+
+    def __repr__(self) -> str:
+        return (
+            f"EpistemicSnapshot(confidence={self.confidence!r}, "
+            f"sources={self.sources!r}, notes={self.notes!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EpistemicSnapshot):
+            return NotImplemented
+        return (self.confidence, self.sources, self.notes) == (
+            other.confidence,
+            other.sources,
+            other.notes,
+        )
+
+    __hash__ = None  # type: ignore[assignment]  # mutable, like a non‑frozen dataclass
 
-    confidence: ConfidenceLevel
-    sources: List[str] = field(default_factory=list)
-    notes: str = ""
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Explicit, so pickling works the same when the module is compiled
+        return (type(self), (self.confidence, self.sources, self.notes))
 
     def as_dict(self) -> Dict[str, Any]:
         return {
@@ -35,9 +94,12 @@ class EpistemicSnapshot:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IdentityProfile:
-    """Core identity of Machine Spirit that rarely changes."""
+    """Core identity of Machine Spirit that rarely changes.
+
+    Frozen: replace it through :meth:`SelfModel.set_identity`.
+    """
 
     name: str = "Machine Spirit"
     version: str = "0.0.1"
@@ -46,8 +108,11 @@ class IdentityProfile:
         "Local autonomous AI being with multimodal perception, creativity and self‑improvement."
     )
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _reduce_frozen(self)
+
 
-@dataclass
+@dataclass(slots=True)
 class CapabilityProfile:
     """What Machine Spirit believes it can do."""
 
@@ -63,7 +128,7 @@ class CapabilityProfile:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeStatus:
     """High‑level runtime status snapshot."""
 
@@ -76,7 +141,7 @@ class RuntimeStatus:
     active_sessions: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BehavioralProfile:
     """How Machine Spirit tends to communicate and behave."""
 
@@ -85,15 +150,27 @@ class BehavioralProfile:
     formality: Literal["casual", "professional", "ceremonial"] = "professional"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GoalState:
-    """Tracks short‑term and long‑term goals."""
+    """Tracks short‑term and long‑term goals.
+
+    Frozen snapshot: change goals through the ``SelfModel`` goal methods or
+    by assigning a new ``GoalState`` to :attr:`SelfModel.goals`.
+    """
+
+    session_goals: Sequence[str] = ()
+    long_term_goals: Sequence[str] = ()
+
+    def __post_init__(self) -> None:
+        # Accept any sequence (e.g. a list) but store immutable tuples
+        object.__setattr__(self, "session_goals", tuple(self.session_goals))
+        object.__setattr__(self, "long_term_goals", tuple(self.long_term_goals))
 
-    session_goals: List[str] = field(default_factory=list)
-    long_term_goals: List[str] = field(default_factory=list)
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _reduce_frozen(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class SensoryState:
     """Aggregated state from perception modules."""
 
@@ -104,17 +181,23 @@ class SensoryState:
     detected_faces: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VoiceProfile:
-    """Simplified voice profile description."""
+    """Simplified voice profile description.
+
+    Frozen: replace it through :meth:`SelfModel.set_voice`.
+    """
 
     name: str = "Machine Spirit Default"
     style: str = "calm_technical"
     pitch: str = "medium_low"
     pace: str = "slightly_fast"
 
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return _reduce_frozen(self)
 
-@dataclass
+
+@dataclass(slots=True)
 class NarrativeEvent:
     """Single narrative log entry in Machine Spirit's 'inner story'."""
 
@@ -135,35 +218,110 @@ class SelfModel:
 
     def __init__(
         self,
-        identity: Optional.IdentityProfile = None,  # type: ignore[valid-type]
-        capabilities: Optional.CapabilityProfile = None,  # type: ignore[valid-type]
+        identity: Optional[IdentityProfile] = None,
+        capabilities: Optional[CapabilityProfile] = None,
+        narrative_cap: int = 512,
     ) -> None:
-        self.identity: IdentityProfile = identity or IdentityProfile()
+        self._identity: IdentityProfile = identity or IdentityProfile()
         self.capabilities: CapabilityProfile = capabilities or CapabilityProfile()
         self.runtime: RuntimeStatus = RuntimeStatus()
         self.behavior: BehavioralProfile = BehavioralProfile()
-        self.goals: GoalState = GoalState()
+        # Ordered goal lists plus set indexes for O(1) duplicate checks. Only
+        # the goal methods and the ``goals`` setter touch them, so the two
+        # always agree; ``goals`` hands out frozen snapshots.
+        self._session_goals: List[str] = []
+        self._long_term_goals: List[str] = []
+        self._session_goal_index: Set[str] = set()
+        self._long_term_goal_index: Set[str] = set()
         self.sensory: SensoryState = SensoryState()
-        self.voice: VoiceProfile = VoiceProfile()
-        self.narrative: List[NarrativeEvent] = []
+        self._voice: VoiceProfile = VoiceProfile()
+        # Bounded story log of pre‑serialized NarrativeEvent dicts; the oldest
+        # entries fall off once ``narrative_cap`` is reached.
+        self.narrative: Deque[Dict[str, Any]] = deque(maxlen=narrative_cap)
         self.last_epistemic: Optional[EpistemicSnapshot] = None
 
+        # Pre‑built dict views of the frozen identity and voice profiles, so
+        # exports do not have to walk them on every call. Refreshed by
+        # set_identity / set_voice, the only way to change those profiles.
+        self._identity_cache: Dict[str, Any] = {}
+        self._identity_brief_cache: Dict[str, Any] = {}
+        self._voice_cache: Dict[str, Any] = {}
+        self._identity_json: bytes = b""
+        self._refresh_identity_cache()
+        self._refresh_voice_cache()
+
+        # Pre‑encoded JSON for the mutable behavior profile and current mode,
+        # tagged with the values they were built from. to_lightweight_json
+        # rebuilds them whenever those values have changed, however that
+        # happened.
+        # ``None`` tags mean "not encoded yet", so the first call always builds.
+        self._behavior_json_for: Optional[Tuple[str, str, str]] = None
+        self._behavior_json: bytes = b""
+        self._mode_json_for: Optional[str] = None
+        self._mode_json: bytes = b""
+
         # Simple counters for internal analytics
         self._session_counter: int = 0
         self._message_counter: int = 0
 
+    # ------------------------------------------------------------------
+    # Frozen profiles (assignment goes through the cache‑refreshing setters)
+    # ------------------------------------------------------------------
+
+    @property
+    def identity(self) -> IdentityProfile:
+        return self._identity
+
+    @identity.setter
+    def identity(self, identity: IdentityProfile) -> None:
+        self.set_identity(identity)
+
+    @property
+    def voice(self) -> VoiceProfile:
+        return self._voice
+
+    @voice.setter
+    def voice(self, voice: VoiceProfile) -> None:
+        self.set_voice(voice)
+
+    @property
+    def goals(self) -> GoalState:
+        return GoalState(tuple(self._session_goals), tuple(self._long_term_goals))
+
+    @goals.setter
+    def goals(self, goals: GoalState) -> None:
+        """Replace all goals, dropping duplicates while keeping order."""
+        self._session_goals = list(dict.fromkeys(goals.session_goals))
+        self._long_term_goals = list(dict.fromkeys(goals.long_term_goals))
+        self._session_goal_index = set(self._session_goals)
+        self._long_term_goal_index = set(self._long_term_goals)
+
     # ------------------------------------------------------------------
     # Update methods
     # ------------------------------------------------------------------
 
-    def track_activity(self, user_id: str, session_id: str) -> None:
-        """Update high‑level runtime state when a new message arrives."""
+    def track_activity(self, user_id: str, session_id: str, now: Optional[float] = None) -> None:
+        """Update high‑level runtime state when a new message arrives.
+
+        ``now`` lets callers reuse a timestamp they already took for this
+        message; it defaults to the current wall‑clock time.
+        """
         _ = (user_id, session_id)  # not yet used, but reserved for per‑user stats
-        self.runtime.last_activity_ts = time.time()
+        self.runtime.last_activity_ts = time.time() if now is None else now
         self._message_counter += 1
         # active_sessions is a soft heuristic here; a real system would track sessions explicitly
         self.runtime.active_sessions = max(self.runtime.active_sessions, 1)
 
+    def set_identity(self, identity: IdentityProfile) -> None:
+        """Replace the identity profile and refresh its cached views."""
+        self._identity = identity
+        self._refresh_identity_cache()
+
+    def set_voice(self, voice: VoiceProfile) -> None:
+        """Replace the voice profile and refresh its cached view."""
+        self._voice = voice
+        self._refresh_voice_cache()
+
     def set_current_mode(self, mode: str) -> None:
         """Record the current operational mode."""
         self.runtime.current_mode = mode
@@ -200,25 +358,78 @@ class SelfModel:
             self.sensory.detected_faces = int(detected_faces)
 
     def add_session_goal(self, goal: str) -> None:
-        if goal not in self.goals.session_goals:
-            self.goals.session_goals.append(goal)
+        if goal not in self._session_goal_index:
+            self._session_goal_index.add(goal)
+            self._session_goals.append(goal)
 
     def add_long_term_goal(self, goal: str) -> None:
-        if goal not in self.goals.long_term_goals:
-            self.goals.long_term_goals.append(goal)
+        if goal not in self._long_term_goal_index:
+            self._long_term_goal_index.add(goal)
+            self._long_term_goals.append(goal)
+
+    def remove_session_goal(self, goal: str) -> None:
+        if goal in self._session_goal_index:
+            self._session_goal_index.discard(goal)
+            self._session_goals.remove(goal)
+
+    def remove_long_term_goal(self, goal: str) -> None:
+        if goal in self._long_term_goal_index:
+            self._long_term_goal_index.discard(goal)
+            self._long_term_goals.remove(goal)
 
     def clear_session_goals(self) -> None:
-        self.goals.session_goals.clear()
-
-    def log_event(self, event_type: str, description: str, metadata: Optional[Dict[str, Any]] = None) -> None:
-        """Append a new narrative event to the internal story log."""
-        evt = NarrativeEvent(
-            timestamp=time.time(),
-            event_type=event_type,
-            description=description,
-            metadata=metadata or {},
+        self._session_goals.clear()
+        self._session_goal_index.clear()
+
+    def log_event(
+        self,
+        event_type: str,
+        description: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        """Append a new narrative event to the internal story log.
+
+        Events are stored in their serialized ``NarrativeEvent`` shape so
+        exporting them does not require a conversion step. ``now`` overrides
+        the event timestamp, as in :meth:`track_activity`.
+        """
+        self.narrative.append(
+            {
+                "timestamp": time.time() if now is None else now,
+                "event_type": event_type,
+                "description": description,
+                "metadata": metadata or {},
+            }
         )
-        self.narrative.append(evt)
+
+    # ------------------------------------------------------------------
+    # Cached views
+    # ------------------------------------------------------------------
+
+    def _refresh_identity_cache(self) -> None:
+        identity = self.identity
+        self._identity_cache = {
+            "name": identity.name,
+            "version": identity.version,
+            "build_codename": identity.build_codename,
+            "description": identity.description,
+        }
+        self._identity_brief_cache = {
+            "name": identity.name,
+            "version": identity.version,
+            "build_codename": identity.build_codename,
+        }
+        self._identity_json = _json_bytes(self._identity_brief_cache)
+
+    def _refresh_voice_cache(self) -> None:
+        voice = self.voice
+        self._voice_cache = {
+            "name": voice.name,
+            "style": voice.style,
+            "pitch": voice.pitch,
+            "pace": voice.pace,
+        }
 
     # ------------------------------------------------------------------
     # Introspection / export
@@ -226,16 +437,49 @@ class SelfModel:
 
     def to_dict(self) -> Dict[str, Any]:
         """Return a full serializable snapshot of the self‑model."""
+        capabilities = self.capabilities
+        runtime = self.runtime
+        behavior = self.behavior
+        sensory = self.sensory
+        narrative = self.narrative
         return {
-            "identity": asdict(self.identity),
-            "capabilities": asdict(self.capabilities),
-            "runtime": asdict(self.runtime),
-            "behavior": asdict(self.behavior),
-            "goals": asdict(self.goals),
-            "sensory": asdict(self.sensory),
-            "voice": asdict(self.voice),
+            "identity": dict(self._identity_cache),
+            "capabilities": {
+                "modes": list(capabilities.modes),
+                "tools": list(capabilities.tools),
+                "limitations": list(capabilities.limitations),
+            },
+            "runtime": {
+                "host_os": runtime.host_os,
+                "cpu_load": runtime.cpu_load,
+                "memory_usage": runtime.memory_usage,
+                "network_ok": runtime.network_ok,
+                "last_activity_ts": runtime.last_activity_ts,
+                "current_mode": runtime.current_mode,
+                "active_sessions": runtime.active_sessions,
+            },
+            "behavior": {
+                "verbosity": behavior.verbosity,
+                "humor_level": behavior.humor_level,
+                "formality": behavior.formality,
+            },
+            "goals": {
+                "session_goals": list(self._session_goals),
+                "long_term_goals": list(self._long_term_goals),
+            },
+            "sensory": {
+                "audio_scene": sensory.audio_scene,
+                "last_sounds": list(sensory.last_sounds),
+                "vision_scene": sensory.vision_scene,
+                "detected_objects": list(sensory.detected_objects),
+                "detected_faces": sensory.detected_faces,
+            },
+            "voice": dict(self._voice_cache),
             "last_epistemic": self.last_epistemic.as_dict() if self.last_epistemic else None,
-            "narrative": [asdict(evt) for evt in self.narrative[-50:]],  # limit for sanity
+            "narrative": [
+                {**evt, "metadata": dict(evt["metadata"])}
+                for evt in islice(narrative, max(len(narrative) - NARRATIVE_EXPORT_LIMIT, 0), None)
+            ],
             "stats": {
                 "message_count": self._message_counter,
             },
@@ -244,11 +488,7 @@ class SelfModel:
     def to_lightweight_dict(self) -> Dict[str, Any]:
         """Return a reduced snapshot suitable for attaching to chat replies."""
         return {
-            "identity": {
-                "name": self.identity.name,
-                "version": self.identity.version,
-                "build_codename": self.identity.build_codename,
-            },
+            "identity": dict(self._identity_brief_cache),
             "runtime": {
                 "current_mode": self.runtime.current_mode,
                 "last_activity_ts": self.runtime.last_activity_ts,
@@ -261,3 +501,43 @@ class SelfModel:
             "last_epistemic": self.last_epistemic.as_dict() if self.last_epistemic else None,
         }
 
+    def to_lightweight_json(self) -> bytes:
+        """Return :meth:`to_lightweight_dict` encoded as compact JSON bytes.
+
+        Identity, behavior and mode are spliced in from pre‑encoded
+        fragments, re‑encoded only when their source values have changed;
+        the activity timestamp and the last epistemic snapshot are encoded
+        per call. The result can be written to a response body as‑is.
+        """
+        behavior = self.behavior
+        behavior_key = (behavior.verbosity, behavior.humor_level, behavior.formality)
+        if behavior_key != self._behavior_json_for:
+            self._behavior_json = _json_bytes(
+                {
+                    "verbosity": behavior_key[0],
+                    "humor_level": behavior_key[1],
+                    "formality": behavior_key[2],
+                }
+            )
+            self._behavior_json_for = behavior_key
+        mode = self.runtime.current_mode
+        if mode != self._mode_json_for:
+            self._mode_json = _json_bytes(mode)
+            self._mode_json_for = mode
+
+        epistemic = self.last_epistemic
+        return b"".join(
+            (
+                b'{"identity":',
+                self._identity_json,
+                b',"runtime":{"current_mode":',
+                self._mode_json,
+                b',"last_activity_ts":',
+                _json_bytes(self.runtime.last_activity_ts),
+                b'},"behavior":',
+                self._behavior_json,
+                b',"last_epistemic":',
+                _json_bytes(epistemic.as_dict() if epistemic else None),
+                b"}",
+            )
+        )
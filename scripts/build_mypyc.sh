@@ -0,0 +1,28 @@
+#!/usr/bin/env bash
+# Compile the backend core modules to C extensions with mypyc.
+#
+# The resulting .so files are placed next to their sources and take
+# precedence over the .py files on import; delete them (or run with
+# --clean) to go back to the pure-Python modules.
+#
+# Requires: pip install mypy
+set -euo pipefail
+
+ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$ROOT"
+
+MODULES=(
+    backend/core/self_model.py
+    backend/core/conversation_store.py
+    backend/core/orchestrator.py
+)
+
+if [[ "${1:-}" == "--clean" ]]; then
+    rm -rf build
+    find backend -name '*.so' -delete
+    find . -maxdepth 1 -name '*__mypyc*.so' -delete
+    exit 0
+fi
+
+MYPYC_OPT_LEVEL="${MYPYC_OPT_LEVEL:-3}" \
+    mypyc --ignore-missing-imports "${MODULES[@]}"
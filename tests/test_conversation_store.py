@@ -0,0 +1,193 @@
+"""Tests for the conversation store backends, using an in‑memory fake Redis."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from backend.core.conversation_store import InMemoryConversationStore, RedisConversationStore
+
+
+def _b(value: Any) -> bytes:
+    return value if isinstance(value, bytes) else str(value).encode("utf-8")
+
+
+class FakeRedis:
+    """Just enough of redis-py's API for RedisConversationStore (bytes replies)."""
+
+    def __init__(self) -> None:
+        self.lists: Dict[str, List[bytes]] = {}
+        self.hashes: Dict[str, Dict[bytes, bytes]] = {}
+        self.ttls: Dict[str, int] = {}
+
+    def expire_now(self, *keys: str) -> None:
+        """Simulate the TTL running out for ``keys``."""
+        self.delete(*keys)
+
+    # -- commands --------------------------------------------------------
+
+    def rpush(self, key: str, value: Any) -> int:
+        items = self.lists.setdefault(key, [])
+        items.append(_b(value))
+        return len(items)
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        items = self.lists.get(key, [])
+        stop = len(items) if end == -1 else end + 1
+        self.lists[key] = items[start:stop]
+        return True
+
+    def lrange(self, key: str, start: int, end: int) -> List[bytes]:
+        items = self.lists.get(key, [])
+        stop = len(items) if end == -1 else end + 1
+        return list(items[start:stop])
+
+    def hsetnx(self, key: str, field: str, value: Any) -> int:
+        fields = self.hashes.setdefault(key, {})
+        if _b(field) in fields:
+            return 0
+        fields[_b(field)] = _b(value)
+        return 1
+
+    def hincrby(self, key: str, field: str, amount: int) -> int:
+        fields = self.hashes.setdefault(key, {})
+        value = int(fields.get(_b(field), b"0")) + amount
+        fields[_b(field)] = _b(value)
+        return value
+
+    def hget(self, key: str, field: str) -> Any:
+        return self.hashes.get(key, {}).get(_b(field))
+
+    def hmget(self, key: str, *fields: str) -> List[Any]:
+        return [self.hget(key, f) for f in fields]
+
+    def expire(self, key: str, seconds: int) -> bool:
+        self.ttls[key] = seconds
+        return True
+
+    def delete(self, *keys: str) -> int:
+        removed = 0
+        for key in keys:
+            removed += (self.lists.pop(key, None) is not None) + (self.hashes.pop(key, None) is not None)
+            self.ttls.pop(key, None)
+        return removed
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis) -> None:
+        self._client = client
+        self._ops: List[Callable[[], Any]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "FakePipeline"]:
+        command = getattr(self._client, name)
+
+        def queue(*args: Any) -> "FakePipeline":
+            self._ops.append(lambda: command(*args))
+            return self
+
+        return queue
+
+    def execute(self) -> List[Any]:
+        return [op() for op in self._ops]
+
+
+def _msg(i: int) -> Dict[str, Any]:
+    return {"role": "user", "content": f"m{i}", "metadata": {"i": i}}
+
+
+def test_in_memory_store_trims_history_and_evicts_lru_session() -> None:
+    store = InMemoryConversationStore(max_history=2, max_sessions=2)
+    for i in range(3):
+        store.append("a", _msg(i))
+    store.append("b", _msg(0))
+    store.append("a", _msg(3))  # "a" becomes most recently used
+    store.append("c", _msg(0))  # evicts "b"
+
+    assert store.get("a") == [_msg(2), _msg(3)]
+    assert store.get("b") == []
+    assert store.get("c") == [_msg(0)]
+    store.clear("a")
+    assert store.get("a") == []
+
+
+def test_redis_store_append_trim_get_clear() -> None:
+    fake = FakeRedis()
+    store = RedisConversationStore(max_history=3, ttl_seconds=60, client=fake)
+    for i in range(5):
+        store.append("a", _msg(i))
+
+    assert store.get("a") == [_msg(2), _msg(3), _msg(4)]
+    assert store.get("a") == [_msg(2), _msg(3), _msg(4)]  # served from cache
+    store.append("a", _msg(5))
+    assert store.get("a") == [_msg(3), _msg(4), _msg(5)]
+    assert set(fake.ttls.values()) == {60}
+
+    store.clear("a")
+    assert store.get("a") == []
+    assert fake.lists == {} and fake.hashes == {}
+
+
+def test_redis_store_cache_sees_other_workers_appends() -> None:
+    fake = FakeRedis()
+    first = RedisConversationStore(max_history=3, client=fake)
+    second = RedisConversationStore(max_history=3, client=fake)
+    for i in range(3):
+        first.append("a", _msg(i))
+    assert first.get("a") == [_msg(0), _msg(1), _msg(2)]  # now cached
+
+    second.append("a", _msg(3))
+    assert first.get("a") == [_msg(1), _msg(2), _msg(3)]
+
+    first.append("a", _msg(4))  # still consistent after reloading
+    assert first.get("a") == second.get("a") == [_msg(2), _msg(3), _msg(4)]
+
+
+def test_redis_store_cache_does_not_outlive_clear_or_expiry() -> None:
+    fake = FakeRedis()
+    first = RedisConversationStore(max_history=3, client=fake)
+    second = RedisConversationStore(max_history=3, client=fake)
+    first.append("a", _msg(0))
+    assert first.get("a") == [_msg(0)]
+
+    # Same length and seq as the cached copy, but a different session epoch.
+    second.clear("a")
+    second.append("a", _msg(1))
+    assert first.get("a") == [_msg(1)]
+
+    fake.expire_now(first._key("a"), first._meta_key("a"))
+    assert first.get("a") == []
+
+
+def test_redis_store_without_cache_reads_through() -> None:
+    fake = FakeRedis()
+    store = RedisConversationStore(max_history=3, cache_sessions=0, client=fake)
+    store.append("a", _msg(0))
+    assert store.get("a") == [_msg(0)]
+    assert store._cache == {}
+
+
+def test_redis_store_cache_hit_returns_the_stored_encoding() -> None:
+    fake = FakeRedis()
+    store = RedisConversationStore(max_history=3, client=fake)
+    store.append("a", _msg(0))
+    assert store.get("a") == [_msg(0)]  # now cached
+
+    message: Dict[str, Any] = {1: "k", "t": (1, 2)}
+    store.append("a", message)
+    message["late"] = True
+
+    expected = [_msg(0), {"1": "k", "t": [1, 2]}]
+    assert store.get("a") == expected
+    assert RedisConversationStore(max_history=3, client=fake).get("a") == expected
+
+
+@pytest.mark.parametrize("max_history", [0, -1])
+def test_stores_reject_non_positive_history_cap(max_history: int) -> None:
+    with pytest.raises(ValueError):
+        InMemoryConversationStore(max_history=max_history, max_sessions=1)
+    with pytest.raises(ValueError):
+        RedisConversationStore(max_history=max_history, client=FakeRedis())
@@ -0,0 +1,90 @@
+"""Tests for MachineSpiritOrchestrator's message hot path."""
+
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from backend.core.conversation_store import InMemoryConversationStore
+from backend.core.orchestrator import MachineSpiritOrchestrator, OrchestratorConfig
+from backend.core.self_model import EpistemicSnapshot, SelfModel
+
+
+def _orchestrator(**config: object) -> MachineSpiritOrchestrator:
+    return MachineSpiritOrchestrator(SelfModel(), OrchestratorConfig(**config))  # type: ignore[arg-type]
+
+
+def test_caller_snapshot_is_never_reused() -> None:
+    orchestrator = _orchestrator()
+    mine = EpistemicSnapshot("high", ["user"], "mine")
+    orchestrator.self_model.update_epistemic_state(mine)
+
+    replies = [orchestrator.handle_message("s", "u", f"m{i}") for i in range(3)]
+
+    assert mine.as_dict() == {"confidence": "high", "sources": ["user"], "notes": "mine"}
+    assert orchestrator.self_model.last_epistemic is not mine
+    assert all(r["epistemic"]["confidence"] == "low" for r in replies)
+
+
+def test_self_model_stays_picklable_after_messages() -> None:
+    orchestrator = _orchestrator()
+    orchestrator.handle_message("s", "u", "hello")
+
+    restored = pickle.loads(pickle.dumps(orchestrator.self_model))
+    assert restored.to_dict() == orchestrator.self_model.to_dict()
+    assert copy.deepcopy(orchestrator.self_model).to_dict() == orchestrator.self_model.to_dict()
+
+
+def test_build_store_selects_backend_and_rejects_unknown_ones() -> None:
+    assert isinstance(_orchestrator()._conversations, InMemoryConversationStore)
+    with pytest.raises(ValueError):
+        _orchestrator(store_backend="sqlite")
+    with pytest.raises(ValueError):
+        _orchestrator(max_history_messages=0)
+
+
+def test_content_pool_shares_user_text_and_evicts_at_capacity() -> None:
+    orchestrator = _orchestrator(content_pool_size=2)
+    for text in ("hi", "hello", "hey"):
+        orchestrator.handle_message("a", "u", "".join(text))  # fresh str objects
+    orchestrator.handle_message("b", "u", "".join(["h", "ey"]))
+
+    # Only user payloads are pooled, least recently used first out.
+    assert list(orchestrator._content_pool) == ["hello", "hey"]
+    first = orchestrator.get_conversation_history("a")[-2]["content"]
+    second = orchestrator.get_conversation_history("b")[0]["content"]
+    assert first == second == "hey" and first is second
+
+
+def test_content_pool_skips_long_text_and_serializing_stores() -> None:
+    orchestrator = _orchestrator(content_pool_max_len=4)
+    orchestrator.handle_message("a", "u", "hello")
+    assert not orchestrator._content_pool
+
+    class SerializingStore:
+        # Standalone rather than a subclass: compiled store classes can't be extended.
+        serializes_messages = True
+
+        def __init__(self) -> None:
+            self.inner = InMemoryConversationStore(max_history=10, max_sessions=10)
+            self.append, self.get, self.clear = self.inner.append, self.inner.get, self.inner.clear
+
+    store = SerializingStore()
+    orchestrator = MachineSpiritOrchestrator(SelfModel(), store=store)
+    orchestrator.handle_message("a", "u", "hi")
+    assert not orchestrator._content_pool
+
+
+def test_metadata_is_not_shared_between_messages() -> None:
+    orchestrator = _orchestrator()
+    orchestrator.handle_message("a", "u", "one")
+    orchestrator.handle_message("b", "u", "two")
+
+    orchestrator.get_conversation_history("a")[0]["metadata"]["leak"] = 1
+    orchestrator.handle_message("c", "u", "three")
+    assert orchestrator.get_conversation_history("b")[0]["metadata"] == {}
+    assert orchestrator.get_conversation_history("c")[0]["metadata"] == {}
+    assert json.dumps(orchestrator.get_conversation_history("c"))
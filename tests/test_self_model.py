@@ -0,0 +1,89 @@
+"""Tests for SelfModel state updates and export paths."""
+
+from __future__ import annotations
+
+from dataclasses import FrozenInstanceError, asdict
+import json
+
+import pytest
+
+from backend.core.self_model import GoalState, IdentityProfile, SelfModel, VoiceProfile
+
+
+def test_lightweight_json_matches_dict_after_direct_mutation() -> None:
+    model = SelfModel()
+    assert json.loads(model.to_lightweight_json()) == model.to_lightweight_dict()
+
+    model.behavior.verbosity = "detailed"
+    model.runtime.current_mode = "OPS"
+    assert json.loads(model.to_lightweight_json()) == model.to_lightweight_dict()
+
+    model.set_current_mode("DEV")
+    model.track_activity(user_id="u", session_id="s", now=123.5)
+    assert json.loads(model.to_lightweight_json()) == model.to_lightweight_dict()
+
+
+def test_identity_and_voice_assignment_refreshes_exports() -> None:
+    model = SelfModel()
+    model.identity = IdentityProfile(name="Other Spirit")
+    model.voice = VoiceProfile(style="ceremonial")
+
+    assert model.to_lightweight_dict()["identity"]["name"] == "Other Spirit"
+    assert model.to_dict()["identity"]["name"] == "Other Spirit"
+    assert model.to_dict()["voice"]["style"] == "ceremonial"
+    assert json.loads(model.to_lightweight_json())["identity"]["name"] == "Other Spirit"
+
+    # The profiles themselves are frozen, and replies get their own copy.
+    with pytest.raises(FrozenInstanceError):
+        model.identity.name = "X"  # type: ignore[misc]
+    model.to_lightweight_dict()["identity"]["name"] = "Y"
+    assert model.to_lightweight_dict()["identity"]["name"] == "Other Spirit"
+
+
+def test_goals_cannot_drift_from_their_index() -> None:
+    model = SelfModel()
+    model.add_session_goal("x")
+    model.add_session_goal("x")
+    assert model.goals.session_goals == ("x",)
+
+    # Snapshots are immutable, so the old list-mutation bypasses now fail loudly.
+    with pytest.raises(AttributeError):
+        model.goals.session_goals.clear()  # type: ignore[attr-defined]
+    with pytest.raises(FrozenInstanceError):
+        model.goals.session_goals = ()  # type: ignore[misc]
+
+    model.clear_session_goals()
+    model.add_session_goal("x")
+    assert model.goals.session_goals == ("x",)
+
+    model.goals = GoalState(session_goals=["x", "x"], long_term_goals=["y"])
+    model.add_session_goal("x")
+    model.add_long_term_goal("y")
+    assert model.goals == GoalState(("x",), ("y",))
+
+    model.remove_session_goal("x")
+    model.remove_session_goal("x")  # second removal is a no-op
+    model.add_session_goal("x")
+    assert model.goals.session_goals == ("x",)
+
+
+def test_goals_serialize_without_index_fields() -> None:
+    model = SelfModel()
+    model.add_session_goal("a")
+    model.add_long_term_goal("b")
+
+    assert json.loads(json.dumps(asdict(model.goals))) == {"session_goals": ["a"], "long_term_goals": ["b"]}
+    assert model.to_dict()["goals"] == {"session_goals": ["a"], "long_term_goals": ["b"]}
+
+
+def test_lightweight_json_handles_empty_mode_and_behavior_values() -> None:
+    model = SelfModel()
+    model.set_current_mode("")
+    assert json.loads(model.to_lightweight_json()) == model.to_lightweight_dict()
+
+    fresh = SelfModel()
+    fresh.runtime.current_mode = ""
+    fresh.behavior.verbosity = ""  # type: ignore[assignment]
+    fresh.behavior.humor_level = ""  # type: ignore[assignment]
+    fresh.behavior.formality = ""  # type: ignore[assignment]
+    assert json.loads(fresh.to_lightweight_json()) == fresh.to_lightweight_dict()